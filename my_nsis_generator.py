@@ -1,28 +1,51 @@
 from __future__ import annotations
 
+import io
 import json
 import locale
 import logging
+import ntpath
 import os
+import sys
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Final
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Optional, List, Dict, Any, Final, Iterable, Mapping, Set, TextIO, Tuple
 
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-from PIL import Image, ImageTk
-from tkinterdnd2 import DND_FILES, TkinterDnD
-
-# Configuration du logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levellevel)s - %(message)s',
-    handlers=[
-        logging.FileHandler('app.log', encoding='utf-8'),
-        logging.StreamHandler()
-    ]
-)
+
+# Pillow et tkinterdnd2 sont importés à la demande pour accélérer le démarrage
+if TYPE_CHECKING:
+    from PIL import ImageTk
+
 logger = logging.getLogger(__name__)
 
+# Codec JSON le plus rapide disponible : orjson, puis ujson, sinon json
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    try:
+        import ujson as _json_codec
+        _JSON_DUMPS_OPTIONS: Dict[str, Any] = {}
+    except ImportError:
+        _json_codec = json
+        _JSON_DUMPS_OPTIONS = {'separators': (',', ':')}
+
+    def _json_loads(data: bytes) -> Any:
+        return _json_codec.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return _json_codec.dumps(obj, **_JSON_DUMPS_OPTIONS).encode('utf-8')
+
 # Constantes
 WINDOW_MIN_SIZE: Final = (600, 400)
 CONFIG_FILE: Final = "config.json"
@@ -33,12 +56,57 @@ DEFAULT_CONFIG: Final[Dict[str, str]] = {
     'icone': str(DEFAULT_ICON) if DEFAULT_ICON.exists() else ''
 }
 ICON_PREVIEW_SIZE: Final = (32, 32)
+ICON_CACHE_SIZE: Final = 8
+POLL_INTERVAL_MS: Final = 20
 NSIS_EXECUTABLE: Final = "makensis.exe"
 
+# Échappement NSIS des chaînes entre guillemets, en une seule passe str.translate
+_NSIS_ESCAPE: Final = str.maketrans({'"': '$\\"', '$': '$$', '\r': '', '\n': ''})
+# Le chemin d'installation peut contenir des variables NSIS ($PROGRAMFILES...)
+_NSIS_ESCAPE_KEEP_VARS: Final = str.maketrans({'"': '$\\"', '\r': '', '\n': ''})
+
+# Squelette du script NSIS, préparé une seule fois à l'import
+_NSIS_HEADER: Final = '''!define APP_NAME "{app_name}"
+!define INSTALL_DIR "{install_dir}"
+!define ICON "{icon}"
+
+Name "${{APP_NAME}}"
+OutFile "installer.exe"
+InstallDir "${{INSTALL_DIR}}"
+Icon "${{ICON}}"
+ShowInstDetails show
+
+Section "Installation"
+    SetOutPath "$INSTDIR"
+    
+    # Fichiers à installer
+'''
+_NSIS_SHORTCUTS: Final = '''
+    # Création des raccourcis
+    CreateShortcut "$DESKTOP\\${{APP_NAME}}.lnk" "$INSTDIR\\{main_file}" "" "$INSTDIR\\${{ICON}}"
+    CreateDirectory "$SMPROGRAMS\\${{APP_NAME}}"
+    CreateShortcut "$SMPROGRAMS\\${{APP_NAME}}\\${{APP_NAME}}.lnk" "$INSTDIR\\{main_file}" "" "$INSTDIR\\${{ICON}}"
+    CreateShortcut "$SMPROGRAMS\\${{APP_NAME}}\\Désinstaller.lnk" "$INSTDIR\\uninstall.exe"
+
+    WriteUninstaller "$INSTDIR\\uninstall.exe"
+SectionEnd
+
+Section "Uninstall"
+'''
+_NSIS_FOOTER: Final = '''    Delete "$DESKTOP\\${APP_NAME}.lnk"
+    Delete "$SMPROGRAMS\\${APP_NAME}\\${APP_NAME}.lnk"
+    Delete "$SMPROGRAMS\\${APP_NAME}\\Désinstaller.lnk"
+    RMDir "$SMPROGRAMS\\${APP_NAME}"
+    Delete "$INSTDIR\\uninstall.exe"
+    RMDir "$INSTDIR"
+SectionEnd'''
+
 class Config:
     """Gestion de la configuration de l'application avec pattern singleton"""
     _instance: Optional[Config] = None
     _config: Dict[str, Any] = {}
+    _mtime_ns: Optional[int] = None
+    _view: Mapping[str, Any] = MappingProxyType(_config)
     
     def __new__(cls) -> Config:
         if cls._instance is None:
@@ -47,25 +115,71 @@ class Config:
         return cls._instance
     
     def _load_config(self) -> None:
+        """Relit le fichier de configuration uniquement si son mtime a changé"""
+        mtime_ns = None
         try:
-            config_path = Path(CONFIG_FILE)
-            self._config = json.loads(config_path.read_text(encoding='utf-8')) if config_path.exists() else DEFAULT_CONFIG.copy()
+            mtime_ns = os.stat(CONFIG_FILE).st_mtime_ns
+            if mtime_ns == self._mtime_ns:
+                return
+            # Le décodeur JSON reçoit directement les octets UTF-8
+            with open(CONFIG_FILE, 'rb') as f:
+                self._set_config(_json_loads(f.read()), mtime_ns)
+        except FileNotFoundError:
+            # Fichier absent : mtime -1 pour garder les valeurs par défaut en cache
+            if self._mtime_ns != -1:
+                self._set_config(DEFAULT_CONFIG.copy(), -1)
         except Exception as e:
             logger.error(f"Erreur lors du chargement de la configuration: {e}")
-            self._config = DEFAULT_CONFIG.copy()
+            # mtime du fichier invalide mis en cache : pas de relecture tant qu'il ne change pas
+            self._set_config(DEFAULT_CONFIG.copy(), mtime_ns)
+
+    def _set_config(self, config: Dict[str, Any], mtime_ns: Optional[int]) -> None:
+        self._config = config
+        self._view = MappingProxyType(config)
+        self._mtime_ns = mtime_ns
     
     def save_config(self, settings: dict) -> None:
         try:
-            Path(CONFIG_FILE).write_text(json.dumps(settings, indent=4), encoding='utf-8')
-            self._config = settings
+            # Format compact pour les sauvegardes internes (voir export_config).
+            # Sérialisation avant l'ouverture : un échec ne vide pas config.json
+            data = _json_dumps(settings)
+            with open(CONFIG_FILE, 'wb') as f:
+                f.write(data)
+            self._set_config(dict(settings), os.stat(CONFIG_FILE).st_mtime_ns)
             logger.info("Configuration sauvegardée avec succès")
         except Exception as e:
             logger.error(f"Erreur lors de la sauvegarde de la configuration: {e}")
             messagebox.showerror("Erreur", "Impossible de sauvegarder la configuration")
+
+    def export_config(self, path: str, settings: Mapping[str, Any]) -> None:
+        """Exporte la configuration dans un fichier JSON indenté, lisible par un humain"""
+        try:
+            Path(path).write_text(json.dumps(dict(settings), indent=4), encoding='utf-8')
+            logger.info(f"Configuration exportée vers {path}")
+        except Exception as e:
+            logger.error(f"Erreur lors de l'export de la configuration: {e}")
+            messagebox.showerror("Erreur", "Impossible d'exporter la configuration")
     
     @property
-    def settings(self) -> dict:
-        return self._config.copy()
+    def settings(self) -> Mapping[str, Any]:
+        """Vue en lecture seule de la configuration (modifier via save_config)"""
+        self._load_config()
+        return self._view
+
+@lru_cache(maxsize=1)
+def _get_system_language() -> str:
+    """Code langue du système (2 lettres), lu une seule fois"""
+    # Variables d'environnement POSIX, par ordre de priorité
+    for name in ('LC_ALL', 'LC_MESSAGES', 'LANG', 'LANGUAGE'):
+        value = os.environ.get(name)
+        if value:
+            return value[:2].lower()
+    # Windows : langue de l'interface utilisateur
+    if sys.platform == 'win32':
+        import ctypes
+        lang_id = ctypes.windll.kernel32.GetUserDefaultUILanguage()
+        return locale.windows_locale.get(lang_id, 'fr')[:2]
+    return 'fr'
 
 class Translations:
     """Gestion du support multilingue"""
@@ -85,15 +199,21 @@ class Translations:
     }
     
     @staticmethod
-    def get_language():
-        return locale.getdefaultlocale()[0][:2]
+    def get_language() -> str:
+        return _LANG
     
     @staticmethod
     def get_text(key: str) -> str:
-        lang = Translations.get_language()
-        if (lang not in Translations.TRANSLATIONS):
-            lang = 'fr'
-        return Translations.TRANSLATIONS[lang].get(key, key)
+        return _TABLE.get(key, key)
+
+    @classmethod
+    def _refresh_table(cls) -> None:
+        """Sélectionne la table de traduction correspondant à la langue système"""
+        global _LANG, _TABLE
+        system_lang = _get_system_language()
+        _LANG = system_lang if system_lang in cls.TRANSLATIONS else 'fr'
+        # Les clés absentes de la langue choisie retombent sur le français
+        _TABLE = {**cls.TRANSLATIONS['fr'], **cls.TRANSLATIONS[_LANG]}
 
     @classmethod
     def load_translations(cls, custom_file: Optional[str] = None) -> None:
@@ -103,9 +223,15 @@ class Translations:
                 with open(custom_file, 'r', encoding='utf-8') as f:
                     custom_translations = json.load(f)
                     cls.TRANSLATIONS.update(custom_translations)
+                    cls._refresh_table()
             except Exception as e:
                 logger.error(f"Erreur lors du chargement des traductions: {e}")
 
+# Langue résolue une seule fois à l'import plutôt qu'à chaque get_text
+_LANG: str = 'fr'
+_TABLE: Dict[str, str] = {}
+Translations._refresh_table()
+
 class NSISScriptBuilder:
     """Classe utilitaire pour la construction du script NSIS"""
     
@@ -117,56 +243,44 @@ class NSISScriptBuilder:
         fichiers_a_installer: List[str],
         fichier_principal: str
     ) -> str:
-        fichier_principal_nom = Path(fichier_principal).name
-
-        template = f'''!define APP_NAME "{nom_programme}"
-!define INSTALL_DIR "{chemin_installation}"
-!define ICON "{icone}"
-
-Name "${{APP_NAME}}"
-OutFile "installer.exe"
-InstallDir "${{INSTALL_DIR}}"
-Icon "${{ICON}}"
-ShowInstDetails show
-
-Section "Installation"
-    SetOutPath "$INSTDIR"
-    
-    # Fichiers à installer
-    {NSISScriptBuilder._generate_file_entries(fichiers_a_installer)}
-
-    # Création des raccourcis
-    {NSISScriptBuilder._generate_shortcuts(fichier_principal_nom)}
-
-    WriteUninstaller "$INSTDIR\\uninstall.exe"
-SectionEnd
-
-Section "Uninstall"
-    {NSISScriptBuilder._generate_uninstall_commands(fichiers_a_installer)}
-SectionEnd'''
-        return template
-
-    @staticmethod
-    def _generate_file_entries(files: List[str]) -> str:
-        return "\n".join(f'    File "{file}"' for file in files)
-
-    @staticmethod
-    def _generate_shortcuts(main_file: str) -> str:
-        return f'''    CreateShortcut "$DESKTOP\\${{APP_NAME}}.lnk" "$INSTDIR\\{main_file}" "" "$INSTDIR\\${{ICON}}"
-    CreateDirectory "$SMPROGRAMS\\${{APP_NAME}}"
-    CreateShortcut "$SMPROGRAMS\\${{APP_NAME}}\\${{APP_NAME}}.lnk" "$INSTDIR\\{main_file}" "" "$INSTDIR\\${{ICON}}"
-    CreateShortcut "$SMPROGRAMS\\${{APP_NAME}}\\Désinstaller.lnk" "$INSTDIR\\uninstall.exe"'''
+        buffer = io.StringIO()
+        NSISScriptBuilder.write_script(
+            buffer, nom_programme, chemin_installation, icone, fichiers_a_installer, fichier_principal
+        )
+        return buffer.getvalue()
 
     @staticmethod
-    def _generate_uninstall_commands(files: List[str]) -> str:
-        file_deletions = "\n".join(f'    Delete "$INSTDIR\\{Path(file).name}"' for file in files)
-        return f'''{file_deletions}
-    Delete "$DESKTOP\\${{APP_NAME}}.lnk"
-    Delete "$SMPROGRAMS\\${{APP_NAME}}\\${{APP_NAME}}.lnk"
-    Delete "$SMPROGRAMS\\${{APP_NAME}}\\Désinstaller.lnk"
-    RMDir "$SMPROGRAMS\\${{APP_NAME}}"
-    Delete "$INSTDIR\\uninstall.exe"
-    RMDir "$INSTDIR"'''
+    def write_script(
+        fp: TextIO,
+        nom_programme: str,
+        chemin_installation: str,
+        icone: str,
+        fichiers_a_installer: List[str],
+        fichier_principal: str
+    ) -> None:
+        """Écrit le script NSIS section par section dans un fichier texte ouvert"""
+        # Chemins Windows : ntpath gère / et \ quel que soit le système hôte
+        basename = ntpath.basename
+        fichier_principal_nom = basename(fichier_principal).translate(_NSIS_ESCAPE)
+        fp.write(_NSIS_HEADER.format_map({
+            'app_name': nom_programme.translate(_NSIS_ESCAPE),
+            'install_dir': chemin_installation.translate(_NSIS_ESCAPE_KEEP_VARS),
+            'icon': icone.translate(_NSIS_ESCAPE),
+        }))
+
+        # Un seul passage sur les fichiers remplit les lignes File et Delete.
+        # Nom de fichier extrait du chemin brut, puis échappé : l'échappement
+        # de " introduit un \ que basename prendrait pour un séparateur
+        file_lines: List[str] = []
+        delete_lines: List[str] = []
+        for f in fichiers_a_installer:
+            file_lines.append('    File "' + f.translate(_NSIS_ESCAPE) + '"\n')
+            delete_lines.append('    Delete "$INSTDIR\\' + basename(f).translate(_NSIS_ESCAPE) + '"\n')
+
+        fp.writelines(file_lines)
+        fp.write(_NSIS_SHORTCUTS.format_map({'main_file': fichier_principal_nom}))
+        fp.writelines(delete_lines)
+        fp.write(_NSIS_FOOTER)
 
 class NSISTemplate:
     """Classe pour gérer les templates NSIS"""
@@ -190,19 +304,54 @@ class Application(ttk.Frame):
     """
     Classe principale de l'application Tkinter pour générer un script NSIS.
     """
+    # Interpréteur Tk dont les styles ttk ont déjà été configurés
+    _styled_interp: Any = None
+
     def __init__(self, master: Optional[tk.Tk] = None):
         super().__init__(master)
         self.master = master
         self.config = Config()
-        self.fichiers_a_installer: List[str] = []
         self.fichier_principal: Optional[str] = None
+        # Chemins présents dans la liste, pour écarter les doublons en O(1)
+        self._fichiers_set: Set[str] = set()
+        # Génération de script.nsi en cours dans le thread d'écriture
+        self._generation_pending = False
+        # Arguments du dernier script écrit, prévisualisé à l'ouverture de l'onglet
+        self._pending_preview: Optional[Tuple[str, str, str, List[str], str]] = None
         self.selected_template = 'Standard'
         
         self.setup_variables()
         self.setup_window()
-        self.create_widgets()
-        self.setup_dnd()
-        self.load_saved_config()
+        self.create_shell_widgets()
+        self.setup_validation()
+        # Le contenu de l'onglet Configuration est créé après le premier affichage
+        self.master.after_idle(self._run_deferred, [self.populate_config_tab, self.populate_files_section,
+                                                    self.setup_dnd, self.load_saved_config])
+
+    def _run_deferred(self, steps: List[Callable[[], None]]) -> None:
+        """Exécute la première étape et planifie la suivante au passage idle d'après,
+        pour que Tk redessine la fenêtre entre deux étapes"""
+        step, *rest = steps
+        step()
+        if rest:
+            self.master.after_idle(self._run_deferred, rest)
+
+    def setup_validation(self) -> None:
+        """Active les boutons de génération dès que les champs requis sont remplis"""
+        for var in (self.nom_programme_var, self.chemin_installation_var):
+            var.trace_add('write', self._recheck_ready)
+        self._recheck_ready()
+
+    def _recheck_ready(self, *_args) -> None:
+        ready = not self._generation_pending and bool(
+            self.nom_programme_var.get().strip()
+            and self.chemin_installation_var.get().strip()
+            and self._fichiers_set
+            and self.fichier_principal
+        )
+        state = ['!disabled'] if ready else ['disabled']
+        self.generate_btn.state(state)
+        self.compile_btn.state(state)
 
     def setup_window(self) -> None:
         """Configuration de la fenêtre principale"""
@@ -218,16 +367,26 @@ class Application(ttk.Frame):
         self.nom_programme_var = tk.StringVar()
         self.chemin_installation_var = tk.StringVar()
         self.icone_var = tk.StringVar(value="")
+        # Noms Tcl des variables, utilisés par read_inputs
+        self._nom_programme_name = str(self.nom_programme_var)
+        self._chemin_installation_name = str(self.chemin_installation_var)
+        self._icone_name = str(self.icone_var)
         self.icon_preview: Optional[ImageTk.PhotoImage] = None
+        self._icon_cache: OrderedDict[Tuple[str, int], ImageTk.PhotoImage] = OrderedDict()
+        self._icon_request: Optional[Tuple[str, int]] = None
+        self._icon_executor = ThreadPoolExecutor(max_workers=1)
+        self._script_executor = ThreadPoolExecutor(max_workers=1)
         self.template_var = tk.StringVar(value=self.selected_template)
 
-        # Style
-        self.style = ttk.Style()
-        self.style.configure('Header.TLabel', font=('Helvetica', 12, 'bold'))
-        self.style.configure('Section.TLabelframe', padding=10)
+        # Style : global à l'interpréteur Tk, configuré une seule fois par interpréteur
+        if Application._styled_interp is not self.tk:
+            style = ttk.Style(self.master)
+            style.configure('Header.TLabel', font=('Helvetica', 12, 'bold'))
+            style.configure('Section.TLabelframe', padding=10)
+            Application._styled_interp = self.tk
 
-    def create_widgets(self):
-        """Création des widgets"""
+    def create_shell_widgets(self):
+        """Création de la structure de la fenêtre (menu, onglets, boutons)"""
         # Menu
         self.create_menu()
         
@@ -239,16 +398,50 @@ class Application(ttk.Frame):
         self.config_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.config_frame, text="Configuration")
         
+        # Barre de progression
+        self.progress = ttk.Progressbar(self, mode='determinate')
+        self.progress.pack(fill=tk.X, pady=5)
+
+        # Boutons d'action
+        buttons_frame = ttk.Frame(self)
+        buttons_frame.pack(fill=tk.X)
+        self.generate_btn = ttk.Button(buttons_frame, text="Générer le script", command=self.generer_script)
+        self.generate_btn.pack(side=tk.LEFT, padx=5)
+        self.compile_btn = ttk.Button(buttons_frame, text="Compiler", command=self.compile_script)
+        self.compile_btn.pack(side=tk.LEFT, padx=5)
+        ttk.Button(buttons_frame, text="Quitter", command=self.quit_app).pack(side=tk.RIGHT)
+
+        # Ajouter un nouvel onglet pour la prévisualisation
+        self.preview_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.preview_frame, text="Prévisualisation")
+        
+        # Zone de prévisualisation du script
+        preview_label = ttk.Label(self.preview_frame, text="Script NSIS généré :")
+        preview_label.pack(anchor='w')
+        
+        # Configuration initiale du thème pour la zone de prévisualisation
+        self.preview_text = tk.Text(
+            self.preview_frame,
+            height=20,
+            width=80
+        )
+        self.preview_text.pack(fill=tk.BOTH, expand=True)
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+
+    def populate_config_tab(self):
+        """Remplit l'onglet Configuration : informations et icône (après le premier affichage)"""
+        T = _TABLE
+
         # Section informations générales
         info_frame = ttk.LabelFrame(self.config_frame, text="Informations générales", style='Section.TLabelframe')
         info_frame.pack(fill=tk.X, pady=5)
         
         # Nom du programme
-        ttk.Label(info_frame, text=Translations.get_text('program_name')).pack()
+        ttk.Label(info_frame, text=T['program_name']).pack()
         ttk.Entry(info_frame, textvariable=self.nom_programme_var).pack(fill=tk.X)
         
         # Chemin d'installation
-        ttk.Label(info_frame, text=Translations.get_text('install_path')).pack()
+        ttk.Label(info_frame, text=T['install_path']).pack()
         path_frame = ttk.Frame(info_frame)
         path_frame.pack(fill=tk.X)
         ttk.Entry(path_frame, textvariable=self.chemin_installation_var).pack(side=tk.LEFT, fill=tk.X, expand=True)
@@ -261,13 +454,16 @@ class Application(ttk.Frame):
         # Preview de l'icône
         self.preview_canvas = tk.Canvas(icon_frame, width=32, height=32)
         self.preview_canvas.pack(side=tk.LEFT, padx=5)
+        # Élément image unique, réutilisé à chaque changement d'icône
+        self._preview_item = self.preview_canvas.create_image(16, 16)
         
         icon_select_frame = ttk.Frame(icon_frame)
         icon_select_frame.pack(fill=tk.X, expand=True)
         ttk.Entry(icon_select_frame, textvariable=self.icone_var).pack(side=tk.LEFT, fill=tk.X, expand=True)
         ttk.Button(icon_select_frame, text="Parcourir", command=self.choisir_icone).pack(side=tk.LEFT)
 
-        # Section fichiers
+    def populate_files_section(self):
+        """Ajoute la section des fichiers à installer à l'onglet Configuration"""
         files_frame = ttk.LabelFrame(self.config_frame, text="Fichiers à installer", style='Section.TLabelframe')
         files_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         
@@ -289,37 +485,18 @@ class Application(ttk.Frame):
         scrollbar = ttk.Scrollbar(list_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        self.liste_fichiers = tk.Listbox(list_frame, yscrollcommand=scrollbar.set)
+        # Treeview à une colonne : seules les lignes visibles sont dessinées.
+        # L'identifiant de chaque ligne est le chemin du fichier (unique).
+        self.liste_fichiers = ttk.Treeview(
+            list_frame,
+            columns=('path',),
+            show='',
+            selectmode='browse',
+            yscrollcommand=scrollbar.set
+        )
         self.liste_fichiers.pack(fill=tk.BOTH, expand=True)
         scrollbar.config(command=self.liste_fichiers.yview)
 
-        # Barre de progression
-        self.progress = ttk.Progressbar(self, mode='determinate')
-        self.progress.pack(fill=tk.X, pady=5)
-
-        # Boutons d'action
-        buttons_frame = ttk.Frame(self)
-        buttons_frame.pack(fill=tk.X)
-        ttk.Button(buttons_frame, text="Générer le script", command=self.generer_script).pack(side=tk.LEFT, padx=5)
-        ttk.Button(buttons_frame, text="Compiler", command=self.compile_script).pack(side=tk.LEFT, padx=5)
-        ttk.Button(buttons_frame, text="Quitter", command=self.quit_app).pack(side=tk.RIGHT)
-
-        # Ajouter un nouvel onglet pour la prévisualisation
-        self.preview_frame = ttk.Frame(self.notebook)
-        self.notebook.add(self.preview_frame, text="Prévisualisation")
-        
-        # Zone de prévisualisation du script
-        preview_label = ttk.Label(self.preview_frame, text="Script NSIS généré :")
-        preview_label.pack(anchor='w')
-        
-        # Configuration initiale du thème pour la zone de prévisualisation
-        self.preview_text = tk.Text(
-            self.preview_frame,
-            height=20,
-            width=80
-        )
-        self.preview_text.pack(fill=tk.BOTH, expand=True)
-
     def create_menu(self):
         """Création de la barre de menu"""
         menubar = tk.Menu(self.master)
@@ -330,6 +507,7 @@ class Application(ttk.Frame):
         menubar.add_cascade(label="Fichier", menu=file_menu)
         file_menu.add_command(label="Sauvegarder configuration", command=self.save_config)
         file_menu.add_command(label="Charger configuration", command=self.load_config)
+        file_menu.add_command(label="Exporter configuration", command=self.export_config)
         file_menu.add_separator()
         file_menu.add_command(label="Quitter", command=self.quit_app)
         
@@ -351,27 +529,94 @@ class Application(ttk.Frame):
 
     def setup_dnd(self):
         """Configuration du drag and drop"""
+        from tkinterdnd2 import DND_FILES
         self.liste_fichiers.drop_target_register(DND_FILES)
         self.liste_fichiers.dnd_bind('<<Drop>>', self.drop_files)
 
     def drop_files(self, event):
         """Gestion du drop de fichiers"""
-        files = event.data.split()
-        for file in files:
-            # Nettoyer le chemin (enlever les {} sous Windows)
-            file = file.strip('{}')
-            self.fichiers_a_installer.append(file)
-            self.liste_fichiers.insert(tk.END, file)
+        # Liste Tcl : les chemins avec espaces sont entourés de {}
+        self.inserer_fichiers(self.tk.splitlist(event.data))
+
+    def inserer_fichiers(self, fichiers: Iterable[str]) -> None:
+        """Ajoute à la liste les fichiers pas encore présents"""
+        nouveaux = [f for f in dict.fromkeys(fichiers) if f not in self._fichiers_set]
+        if nouveaux:
+            self._fichiers_set.update(nouveaux)
+            insert = self.liste_fichiers.insert
+            for fichier in nouveaux:
+                insert('', tk.END, iid=fichier, values=(fichier,))
+            self._recheck_ready()
 
     def update_icon_preview(self, icon_path):
         """Mise à jour de la prévisualisation de l'icône"""
         try:
-            icon = Image.open(icon_path)
-            icon = icon.resize((32, 32), Image.Resampling.LANCZOS)
-            self.icon_preview = ImageTk.PhotoImage(icon)
-            self.preview_canvas.create_image(16, 16, image=self.icon_preview)
+            # Cache LRU indexé par (chemin, mtime) pour éviter décodage et redimensionnement
+            key = (str(icon_path), os.stat(icon_path).st_mtime_ns)
+        except OSError:
+            self._icon_request = None
+            self._clear_icon()
+            return
+
+        self._icon_request = key
+        photo = self._icon_cache.get(key)
+        if photo is not None:
+            self._icon_cache.move_to_end(key)
+            self._show_icon(photo)
+            return
+
+        # Décodage Pillow dans un thread ; le PhotoImage est créé dans le thread Tk
+        future = self._icon_executor.submit(self._decode_icon, icon_path)
+        self._when_done(future, lambda done: self._finalize_icon_preview(key, done))
+
+    def _when_done(self, future: Future, callback: Callable[[Future], None]) -> None:
+        """Appelle callback dans le thread Tk une fois future terminé (scrutation via after)"""
+        if future.done():
+            callback(future)
+        else:
+            self.after(POLL_INTERVAL_MS, self._when_done, future, callback)
+
+    @staticmethod
+    def _decode_icon(icon_path) -> Any:
+        """Ouvre et réduit l'icône à la taille de l'aperçu (exécuté hors du thread Tk)"""
+        # Import différé : seul le premier aperçu paie le chargement de Pillow
+        from PIL import Image
+        icon = Image.open(icon_path)
+        if icon.format == 'ICO':
+            # Plus petite sous-image couvrant l'aperçu (32x32 si présente)
+            candidates = [
+                size for size in icon.info.get('sizes', ())
+                if size[0] >= ICON_PREVIEW_SIZE[0] and size[1] >= ICON_PREVIEW_SIZE[1]
+            ]
+            if candidates:
+                icon.size = min(candidates)
+        icon.thumbnail(ICON_PREVIEW_SIZE, Image.Resampling.BILINEAR)
+        return icon
+
+    def _finalize_icon_preview(self, key: Tuple[str, int], future: Future) -> None:
+        """Affiche l'icône décodée si elle est toujours demandée"""
+        try:
+            from PIL import ImageTk
+            photo = ImageTk.PhotoImage(future.result())
         except Exception:
-            self.preview_canvas.delete("all")
+            if key == self._icon_request:
+                self._clear_icon()
+            return
+
+        self._icon_cache[key] = photo
+        if len(self._icon_cache) > ICON_CACHE_SIZE:
+            self._icon_cache.popitem(last=False)
+        # Une icône choisie entre-temps a priorité
+        if key == self._icon_request:
+            self._show_icon(photo)
+
+    def _show_icon(self, photo: ImageTk.PhotoImage) -> None:
+        self.icon_preview = photo
+        self.preview_canvas.itemconfigure(self._preview_item, image=self.icon_preview)
+
+    def _clear_icon(self) -> None:
+        self.icon_preview = None
+        self.preview_canvas.itemconfigure(self._preview_item, image='')
 
     def show_about(self):
         """Affiche la boîte de dialogue À propos"""
@@ -380,16 +625,29 @@ class Application(ttk.Frame):
             "myNSIS Generator\nVersion 1.1\n\nCréé par Doalo\n2024"
         )
 
-    def save_config(self):
-        """Sauvegarde la configuration actuelle"""
-        config = {
+    def current_settings(self) -> Dict[str, str]:
+        """Configuration correspondant aux champs de saisie"""
+        return {
             'nom_programme': self.nom_programme_var.get(),
             'chemin_installation': self.chemin_installation_var.get(),
             'icone': self.icone_var.get()
         }
-        self.config.save_config(config)
+
+    def save_config(self):
+        """Sauvegarde la configuration actuelle"""
+        self.config.save_config(self.current_settings())
         messagebox.showinfo("Info", "Configuration sauvegardée")
 
+    def export_config(self):
+        """Exporte la configuration actuelle dans un fichier JSON choisi par l'utilisateur"""
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("Fichiers JSON", "*.json")],
+            title="Exporter la configuration"
+        )
+        if file_path:
+            self.config.export_config(file_path, self.current_settings())
+
     def load_saved_config(self):
         """Charge la configuration sauvegardée"""
         config = self.config.settings
@@ -397,7 +655,7 @@ class Application(ttk.Frame):
         self.chemin_installation_var.set(config.get('chemin_installation', ''))
         icon_path = config.get('icone', '')
         self.icone_var.set(icon_path)
-        if icon_path and Path(icon_path).exists():
+        if icon_path and os.path.exists(icon_path):
             self.update_icon_preview(icon_path)
         elif DEFAULT_ICON.exists():
             self.icone_var.set(str(DEFAULT_ICON))
@@ -412,8 +670,8 @@ class Application(ttk.Frame):
                 title="Charger une configuration"
             )
             if file_path:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                with open(file_path, 'rb') as f:
+                    config = _json_loads(f.read())
                     self.nom_programme_var.set(config.get('nom_programme', ''))
                     self.chemin_installation_var.set(config.get('chemin_installation', ''))
                     self.icone_var.set(config.get('icone', ''))
@@ -437,93 +695,129 @@ class Application(ttk.Frame):
 
     def ajouter_fichier(self):
         """Ouvre un dialog pour sélectionner un ou plusieurs fichiers à ajouter."""
-        fichiers = filedialog.askopenfilenames()
-        for fichier in fichiers:
-            self.fichiers_a_installer.append(fichier)
-            self.liste_fichiers.insert(tk.END, fichier)
+        self.inserer_fichiers(filedialog.askopenfilenames())
 
     def definir_fichier_principal(self):
         """
         Définir le fichier principal (exécutable, etc.) à partir
-        de la sélection dans la Listbox.
+        de la sélection dans la liste.
         """
         try:
-            selection_index = self.liste_fichiers.curselection()[0]
+            self.fichier_principal = self.liste_fichiers.selection()[0]
         except IndexError:
             messagebox.showinfo("Info", "Veuillez sélectionner un fichier dans la liste.")
             return
-        self.fichier_principal = self.liste_fichiers.get(selection_index)
+        self._recheck_ready()
         messagebox.showinfo("Fichier principal défini", f"Fichier principal : {self.fichier_principal}")
 
     def supprimer_fichier(self):
         """
-        Supprime le fichier sélectionné de la liste interne et de la Listbox.
+        Supprime le fichier sélectionné de la liste.
         """
         try:
-            selection_index = self.liste_fichiers.curselection()[0]
+            element = self.liste_fichiers.selection()[0]
         except IndexError:
             messagebox.showinfo("Info", "Veuillez sélectionner un fichier à supprimer.")
             return
 
-        element = self.liste_fichiers.get(selection_index)
-        self.liste_fichiers.delete(selection_index)
-        self.fichiers_a_installer.remove(element)
-        if self.fichier_principal == element:
+        self.liste_fichiers.delete(element)
+        self._fichiers_set.discard(element)
+        principal_supprime = self.fichier_principal == element
+        if principal_supprime:
             self.fichier_principal = None
+        self._recheck_ready()
+        if principal_supprime:
             messagebox.showinfo("Info", "Le fichier principal a été supprimé. Veuillez en définir un autre.")
 
-    def generer_script(self) -> bool:
-        """Génère le script NSIS avec validation des entrées"""
+    def generer_script(self, on_success: Optional[Callable[[], None]] = None) -> bool:
+        """
+        Génère le script NSIS avec validation des entrées.
+        Le script est écrit section par section dans un thread pour ne pas bloquer
+        l'interface ; on_success est appelé dans le thread Tk une fois le script écrit.
+        Retourne False si les entrées sont invalides.
+        """
+        nom_programme, chemin_installation, icone, fichiers = self.read_inputs()
+        # Une seule génération à la fois : les boutons restent désactivés jusqu'à la fin
+        if self._generation_pending:
+            return False
+        # Validation des entrées
+        if not self.validate_inputs(nom_programme, chemin_installation, fichiers):
+            return False
+
+        script_path = Path("script.nsi")
+        script_args = (nom_programme, chemin_installation, icone, fichiers, self.fichier_principal)
+
+        def write_script_file() -> None:
+            # Écriture en flux dans un tampon de 64 Ko, sans construire le texte complet
+            with open(script_path, 'w', encoding='utf-8', buffering=1 << 16) as f:
+                NSISScriptBuilder.write_script(f, *script_args)
+
+        self._generation_pending = True
+        self._recheck_ready()
+        self.progress.configure(mode='indeterminate')
+        self.progress.start()
+        future = self._script_executor.submit(write_script_file)
+        self._when_done(future, lambda done: self._on_script_done(done, script_path, script_args, on_success))
+        return True
+
+    def _on_script_done(
+        self,
+        future: Future,
+        script_path: Path,
+        script_args: Tuple[str, str, str, List[str], str],
+        on_success: Optional[Callable[[], None]]
+    ) -> None:
+        """Fin de la génération du script : arrêt de la progression et retour utilisateur"""
+        self._generation_pending = False
+        self._recheck_ready()
+        self.progress.stop()
+        self.progress.configure(mode='determinate')
         try:
-            # Validation des entrées
-            if not self.validate_inputs():
-                return False
-                
-            script = NSISScriptBuilder.build_script(
-                self.nom_programme_var.get().strip(),
-                self.chemin_installation_var.get().strip(),
-                self.icone_var.get().strip(),
-                self.fichiers_a_installer,
-                self.fichier_principal
-            )
-            
-            script_path = Path("script.nsi")
-            script_path.write_text(script, encoding='utf-8')
-            
-            messagebox.showinfo(
-                "Succès",
-                f"Le script NSIS a été généré avec succès:\n{script_path.absolute()}"
-            )
-            
+            future.result()
         except Exception as e:
             logger.error(f"Erreur lors de la génération du script: {e}")
             messagebox.showerror(
                 "Erreur",
                 "Une erreur est survenue lors de la génération du script."
             )
-            return False
+            return
 
-        self.update_preview()
-        return True
+        messagebox.showinfo(
+            "Succès",
+            f"Le script NSIS a été généré avec succès:\n{script_path.absolute()}"
+        )
+        # Prévisualisation construite seulement quand l'onglet est affiché
+        self._pending_preview = script_args
+        self._on_tab_changed()
+        if on_success is not None:
+            on_success()
 
-    def validate_inputs(self) -> bool:
-        """Valide les entrées utilisateur"""
-        if not self.nom_programme_var.get().strip():
-            messagebox.showwarning("Attention", "Veuillez renseigner un nom de programme.")
-            return False
-            
-        if not self.chemin_installation_var.get().strip():
-            messagebox.showwarning("Attention", "Veuillez renseigner un chemin d'installation.")
-            return False
-            
-        if not self.fichiers_a_installer:
-            messagebox.showwarning("Attention", "Veuillez ajouter au moins un fichier à installer.")
-            return False
-            
-        if not self.fichier_principal:
-            messagebox.showwarning("Attention", "Veuillez définir un fichier principal.")
-            return False
-            
+    def read_inputs(self) -> Tuple[str, str, str, List[str]]:
+        """
+        Lit une seule fois les champs nom, chemin d'installation et icône,
+        ainsi que la liste des fichiers (le Treeview fait référence).
+        """
+        # Lecture directe des variables Tcl, sans l'enveloppe StringVar.get()
+        getvar = self.tk.globalgetvar
+        return (
+            str(getvar(self._nom_programme_name)).strip(),
+            str(getvar(self._chemin_installation_name)).strip(),
+            str(getvar(self._icone_name)).strip(),
+            list(self.liste_fichiers.get_children())
+        )
+
+    def validate_inputs(self, nom_programme: str, chemin_installation: str, fichiers: List[str]) -> bool:
+        """Valide les entrées utilisateur (valeurs déjà nettoyées)"""
+        checks = (
+            (nom_programme, "Veuillez renseigner un nom de programme."),
+            (chemin_installation, "Veuillez renseigner un chemin d'installation."),
+            (fichiers, "Veuillez ajouter au moins un fichier à installer."),
+            (self.fichier_principal, "Veuillez définir un fichier principal."),
+        )
+        for value, message in checks:
+            if not value:
+                messagebox.showwarning("Attention", message)
+                return False
         return True
 
     def choisir_chemin(self):
@@ -534,34 +828,53 @@ class Application(ttk.Frame):
 
     def quit_app(self):
         """Quitte l'application."""
+        self._icon_executor.shutdown(wait=False)
+        self._script_executor.shutdown(wait=False)
         self.master.destroy()
 
     def update_preview(self) -> None:
         """Met à jour la prévisualisation du script"""
-        if not self.validate_inputs():
-            self.preview_text.delete('1.0', tk.END)
-            self.preview_text.insert('1.0', "Remplissez tous les champs requis pour voir la prévisualisation")
+        self._pending_preview = None
+        nom_programme, chemin_installation, icone, fichiers = self.read_inputs()
+        if not self.validate_inputs(nom_programme, chemin_installation, fichiers):
+            self._show_preview("Remplissez tous les champs requis pour voir la prévisualisation")
             return
 
         try:
             script = NSISScriptBuilder.build_script(
-                self.nom_programme_var.get().strip(),
-                self.chemin_installation_var.get().strip(),
-                self.icone_var.get().strip(),
-                self.fichiers_a_installer,
+                nom_programme,
+                chemin_installation,
+                icone,
+                fichiers,
                 self.fichier_principal
             )
-            self.preview_text.delete('1.0', tk.END)
-            self.preview_text.insert('1.0', script)
         except Exception as e:
-            self.preview_text.delete('1.0', tk.END)
-            self.preview_text.insert('1.0', f"Erreur de prévisualisation: {str(e)}")
+            script = f"Erreur de prévisualisation: {str(e)}"
+        self._show_preview(script)
+
+    def _on_tab_changed(self, event=None) -> None:
+        if self._pending_preview is not None and self.notebook.select() == str(self.preview_frame):
+            self._show_pending_preview()
+
+    def _show_pending_preview(self) -> None:
+        """Construit la prévisualisation du dernier script écrit"""
+        script_args, self._pending_preview = self._pending_preview, None
+        try:
+            script = NSISScriptBuilder.build_script(*script_args)
+        except Exception as e:
+            script = f"Erreur de prévisualisation: {str(e)}"
+        self._show_preview(script)
+
+    def _show_preview(self, script: str) -> None:
+        self.preview_text.delete('1.0', tk.END)
+        self.preview_text.insert('1.0', script)
 
     def compile_script(self) -> None:
-        """Compile le script NSIS directement"""
-        if not self.generer_script():
-            return
+        """Génère puis compile le script NSIS"""
+        self.generer_script(on_success=self.run_makensis)
 
+    def run_makensis(self) -> None:
+        """Compile le script NSIS généré avec makensis"""
         try:
             # Vérifier si NSIS est installé
             if not Path(NSIS_EXECUTABLE).exists():
@@ -587,6 +900,17 @@ class Application(ttk.Frame):
 
 
 if __name__ == "__main__":
+    # Configuration du logging (uniquement au lancement de l'application)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('app.log', encoding='utf-8'),
+            logging.StreamHandler()
+        ]
+    )
+
+    from tkinterdnd2 import TkinterDnD
     root = TkinterDnD.Tk()
     app = Application(master=root)
     app.mainloop()